@@ -2,16 +2,43 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping, Sequence
 from typing import Any, TypeVar
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
 from urllib.request import urlopen
 
-__all__ = ["normalize_params", "request_bytes"]
+try:
+    import urllib3
+except ImportError:  # pragma: no cover - urllib3 is an optional speed-up.
+    urllib3 = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx is only needed for async requests.
+    httpx = None
+
+__all__ = [
+    "TTLCache",
+    "create_async_client",
+    "normalize_params",
+    "request_bytes",
+    "request_bytes_async",
+]
 
 ErrorT = TypeVar("ErrorT", bound=Exception)
 
+# Shared keep-alive pool so repeated calls to the same host skip the TCP/TLS
+# handshake. Without urllib3 every request opens a fresh ``urlopen`` connection.
+_POOL = (
+    urllib3.PoolManager(maxsize=16, retries=urllib3.Retry(total=2, backoff_factor=0.1))
+    if urllib3 is not None
+    else None
+)
+
 
 def normalize_params(
     params: Mapping[str, Any] | None,
@@ -53,6 +80,58 @@ def normalize_params(
     return normalized
 
 
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire ``ttl`` seconds after insertion.
+
+    Used to memoize idempotent GET responses for the lifetime of the process.
+    """
+
+    def __init__(self, *, maxsize: int = 4096, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _build_request_url(
+    endpoint: str,
+    params: Mapping[str, Any] | None,
+    preserve_bool: bool,
+) -> str:
+    encoded_params = urlencode(
+        normalize_params(params, preserve_bool=preserve_bool),
+        doseq=True,
+    )
+    return endpoint if not encoded_params else f"{endpoint}?{encoded_params}"
+
+
 def request_bytes(
     endpoint: str,
     params: Mapping[str, Any] | None,
@@ -66,13 +145,18 @@ def request_bytes(
     Perform a simple GET request, returning the raw body and headers.
 
     Parameters are URL-encoded using :func:`urlencode` with ``doseq=True`` to
-    support multi-valued items.
+    support multi-valued items. Connections are reused through a shared
+    ``urllib3`` pool when the package is installed.
     """
-    encoded_params = urlencode(
-        normalize_params(params, preserve_bool=preserve_bool),
-        doseq=True,
-    )
-    request_url = endpoint if not encoded_params else f"{endpoint}?{encoded_params}"
+    request_url = _build_request_url(endpoint, params, preserve_bool)
+
+    if _POOL is not None:
+        return _pooled_request_bytes(
+            request_url,
+            timeout=timeout,
+            error_cls=error_cls,
+            service_name=service_name,
+        )
 
     try:
         with urlopen(request_url, timeout=timeout) as response:
@@ -84,3 +168,68 @@ def request_bytes(
         raise error_cls(f"Failed to reach {service_name}: {exc.reason}") from exc
 
     return raw_body, headers
+
+
+def _pooled_request_bytes(
+    request_url: str,
+    *,
+    timeout: float,
+    error_cls: type[ErrorT],
+    service_name: str,
+) -> tuple[bytes, dict[str, str]]:
+    try:
+        response = _POOL.request("GET", request_url, timeout=timeout)
+    except urllib3.exceptions.HTTPError as exc:
+        # The urllib3 error text embeds the request URL (and with it the API key),
+        # so only report the underlying cause, as the ``urlopen`` path does.
+        if isinstance(exc, urllib3.exceptions.MaxRetryError) and exc.reason is not None:
+            reason: object = exc.reason
+        else:
+            reason = type(exc).__name__
+        raise error_cls(f"Failed to reach {service_name}: {reason}") from exc
+
+    if response.status >= 400:
+        raise error_cls(f"{service_name} returned HTTP {response.status}: {response.reason}")
+
+    return response.data, dict(response.headers.items())
+
+
+def create_async_client(timeout: float, *, max_connections: int = 32) -> "httpx.AsyncClient":
+    """
+    Create an ``httpx.AsyncClient`` suitable for :func:`request_bytes_async`.
+
+    The caller owns the client and should close it (``async with``) once the
+    batch of requests is done.
+    """
+    if httpx is None:
+        raise RuntimeError("httpx is required for async requests; install it with 'pip install httpx'.")
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=httpx.Limits(max_connections=max_connections),
+    )
+
+
+async def request_bytes_async(
+    client: "httpx.AsyncClient",
+    endpoint: str,
+    params: Mapping[str, Any] | None,
+    *,
+    timeout: float,
+    error_cls: type[ErrorT],
+    service_name: str,
+    preserve_bool: bool = False,
+) -> tuple[bytes, dict[str, str]]:
+    """Async counterpart of :func:`request_bytes` running on a shared ``httpx`` client."""
+    request_url = _build_request_url(endpoint, params, preserve_bool)
+
+    try:
+        response = await client.get(request_url, timeout=timeout)
+    except httpx.HTTPError as exc:
+        raise error_cls(f"Failed to reach {service_name}: {exc}") from exc
+
+    if response.status_code >= 400:
+        raise error_cls(
+            f"{service_name} returned HTTP {response.status_code}: {response.reason_phrase}"
+        )
+
+    return response.content, dict(response.headers.items())
@@ -14,6 +14,11 @@ from collections.abc import Mapping
 from typing import Any, Literal, MutableMapping
 from ._http_helpers import request_bytes
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speed-up.
+    from json import loads as _json_loads
+
 __all__ = [
     "JusoAPIError",
     "call_juso_api",
@@ -61,7 +66,7 @@ def _perform_request(endpoint: str, params: Mapping[str, Any], timeout: float) -
         preserve_bool=True,
     )
     try:
-        payload = json.loads(raw_body.decode("utf-8"))
+        payload = _json_loads(raw_body)
     except json.JSONDecodeError as exc:
         raise JusoAPIError(f"Failed to decode JSON response: {exc.msg}") from exc
 
@@ -86,7 +91,7 @@ def call_juso_api(
         Query parameters to forward to the API. ``resultType`` is forced to
         ``"json"`` by the public helpers, but callers may override it if needed.
     timeout:
-        Socket timeout in seconds passed to ``urllib.request.urlopen``.
+        Socket timeout in seconds for the HTTP request.
     """
     if endpoint == "road":
         target = JUSO_ROAD_ENDPOINT
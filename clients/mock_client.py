@@ -0,0 +1,42 @@
+"""
+Mock client used by the example jobs and as the manager's fallback source.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from random import random
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy only speeds up large mock batches.
+    np = None
+
+__all__ = ["fetch_transactions"]
+
+
+def _utcnow_iso() -> str:
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat()
+
+
+def _random_amounts(limit: int) -> list[float]:
+    if np is not None:
+        return np.round(np.random.random(limit) * 1000, 2).tolist()
+    return [round(random() * 1000, 2) for _ in range(limit)]
+
+
+def fetch_transactions(*, limit: int = 5, currency: str = "KRW") -> list[dict[str, Any]]:
+    """
+    Generate ``limit`` fake transactions sharing a single ``updated_at`` stamp.
+
+    Amounts are drawn in one vectorized call when NumPy is installed.
+    """
+    if limit <= 0:
+        return []
+    now = _utcnow_iso()
+    return [
+        {"tx_id": f"mock-{index}", "amount": amount, "currency": currency, "updated_at": now}
+        for index, amount in enumerate(_random_amounts(limit))
+    ]
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 import re
 
-from ._http_helpers import normalize_params, request_bytes
+from ._http_helpers import (
+    TTLCache,
+    create_async_client,
+    normalize_params,
+    request_bytes,
+    request_bytes_async,
+)
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speed-up.
+    from json import loads as _json_loads
 
 VWORLD_METADATA_PATH = (Path(__file__).resolve().parent / "vworld" / "vworld_url.json").resolve()
 VWORLD_SEARCH_ENDPOINT = "https://api.vworld.kr/req/search"
@@ -16,6 +29,17 @@ _KOREAN_REQUIRED_FLAG = "필수"
 _REQUEST_KEY = "요청 변수"
 _URL_KEY = "URL"
 
+_ROAD_RE = re.compile(r"([^\d\s]+(?:로|길))\s*(\d+(?:-\d+)?)")
+_PARCEL_RE = re.compile(r"([^\d\s]+)(?:동|리|가)?\s*(\d+(?:-\d+)?)")
+_ROAD_HINT_RE = re.compile(r"\d+\s*(?:로|길|번길)|[^\d\s]+(?:로|길)\s*\d")
+
+# vworld GET responses are stable for the lifetime of an ingestion run, so
+# parsed results are cached (cache-aside) to skip repeated network + parse work.
+_API_RESPONSE_CACHE = TTLCache(maxsize=4096, ttl=3600.0)
+_SEARCH_RESPONSE_CACHE = TTLCache(maxsize=4096, ttl=3600.0)
+_CACHE_MISS = object()
+_CACHEABLE_STATUSES = frozenset({"OK", "NOT_FOUND"})
+
 
 class VWorldAPIError(RuntimeError):
     """Raised when a vworld API call fails."""
@@ -25,6 +49,7 @@ class VWorldAPIError(RuntimeError):
 class VWorldApiDefinition:
     name: str
     metadata: dict[str, Any]
+    required_fields: frozenset[str] = frozenset()
 
     @property
     def endpoint(self) -> str:
@@ -38,10 +63,9 @@ class VWorldApiDefinition:
         return self.metadata.get(_REQUEST_KEY, {})
 
 
-def _load_api_catalog() -> dict[str, VWorldApiDefinition]:
+def _parse_api_metadata() -> dict[str, Any]:
     try:
-        with VWORLD_METADATA_PATH.open(encoding="utf-8") as metadata_file:
-            raw_catalog = json.load(metadata_file)
+        return _json_loads(VWORLD_METADATA_PATH.read_bytes())
     except FileNotFoundError as exc:
         raise VWorldAPIError(f"Missing vworld metadata file: {VWORLD_METADATA_PATH}") from exc
     except json.JSONDecodeError as exc:
@@ -49,23 +73,43 @@ def _load_api_catalog() -> dict[str, VWorldApiDefinition]:
             f"Failed to decode JSON metadata from {VWORLD_METADATA_PATH}: {exc.msg}"
         ) from exc
 
-    return {name: VWorldApiDefinition(name, info) for name, info in raw_catalog.items()}
+
+def _load_api_catalog() -> dict[str, VWorldApiDefinition]:
+    raw_catalog = _parse_api_metadata()
+    return {
+        name: VWorldApiDefinition(
+            name,
+            info,
+            frozenset(
+                field_name
+                for field_name, field_meta in info.get(_REQUEST_KEY, {}).items()
+                if field_meta.get("Required") == _KOREAN_REQUIRED_FLAG
+            ),
+        )
+        for name, info in raw_catalog.items()
+    }
 
 
 _API_CATALOG: dict[str, VWorldApiDefinition] | None = None
+_AVAILABLE_API_NAMES = ""
 
 
 def _get_api_catalog() -> dict[str, VWorldApiDefinition]:
-    global _API_CATALOG
+    global _API_CATALOG, _AVAILABLE_API_NAMES
     if _API_CATALOG is None:
-        _API_CATALOG = _load_api_catalog()
+        catalog = _load_api_catalog()
+        _AVAILABLE_API_NAMES = ", ".join(sorted(catalog))
+        _API_CATALOG = catalog
     return _API_CATALOG
 
 
+@functools.lru_cache(maxsize=None)
 def get_vworld_api_info(api_name: str) -> VWorldApiDefinition:
     """
     Retrieve the metadata for the requested API.
 
+    The catalog is immutable once loaded, so lookups are memoized per name.
+
     Parameters
     ----------
     api_name:
@@ -74,8 +118,9 @@ def get_vworld_api_info(api_name: str) -> VWorldApiDefinition:
     try:
         return _get_api_catalog()[api_name]
     except KeyError as exc:
-        available = ", ".join(sorted(_get_api_catalog().keys()))
-        raise VWorldAPIError(f"Unknown vworld API '{api_name}'. Available APIs: {available}") from exc
+        raise VWorldAPIError(
+            f"Unknown vworld API '{api_name}'. Available APIs: {_AVAILABLE_API_NAMES}"
+        ) from exc
 
 
 def call_vworld_api(
@@ -86,6 +131,7 @@ def call_vworld_api(
     domain: str | None = None,
     timeout: float = 10.0,
     parse_json: bool | None = None,
+    use_cache: bool = True,
 ) -> Any:
     """
     Call one of the vworld OpenAPI endpoints using metadata from ``vworld_url.json``.
@@ -102,12 +148,17 @@ def call_vworld_api(
     domain:
         Optional domain parameter. Injected only when missing from ``params``.
     timeout:
-        Socket timeout (seconds) passed to ``urllib.request.urlopen``.
+        Socket timeout (seconds) for the HTTP request.
     parse_json:
         Force JSON decoding of the response (``True``) or skip it (``False``).
         When ``None`` (default) the function attempts to decode JSON whenever the
         request includes ``format=json`` or the response advertises
         ``Content-Type: application/json``.
+    use_cache:
+        Serve repeated identical requests from an in-process TTL cache. Only
+        parsed JSON results whose ``response.status`` is ``OK`` or
+        ``NOT_FOUND`` are cached. Cached results are shared objects and must
+        not be mutated by callers.
 
     Returns
     -------
@@ -125,7 +176,6 @@ def call_vworld_api(
         raise ValueError("timeout must be greater than zero.")
 
     api_info = get_vworld_api_info(api_name)
-    request_fields = api_info.request_fields
 
     query_params = normalize_params(params)
     if api_key is not None:
@@ -133,16 +183,51 @@ def call_vworld_api(
     if domain is not None:
         query_params.setdefault("domain", domain)
 
-    missing = [
-        field_name
-        for field_name, field_meta in request_fields.items()
-        if field_meta.get("Required") == _KOREAN_REQUIRED_FLAG and field_name not in query_params
-    ]
+    missing = api_info.required_fields - query_params.keys()
     if missing:
         raise VWorldAPIError(
             f"Missing required parameters for '{api_name}': {', '.join(sorted(missing))}"
         )
 
+    cache_key = _api_cache_key(api_name, query_params, parse_json) if use_cache else None
+    if cache_key is not None:
+        cached = _API_RESPONSE_CACHE.get(cache_key, _CACHE_MISS)
+        if cached is not _CACHE_MISS:
+            return cached
+
+    result = _fetch_vworld_api(api_info, query_params, timeout, parse_json)
+    if cache_key is not None and _is_cacheable_api_result(result):
+        _API_RESPONSE_CACHE.set(cache_key, result)
+    return result
+
+
+def _is_cacheable_api_result(result: Any) -> bool:
+    # vworld reports failures (rate limits, invalid keys) as HTTP 200 with
+    # ``response.status == "ERROR"``; only definitive answers are cached.
+    if not isinstance(result, Mapping):
+        return False
+    response = result.get("response")
+    return isinstance(response, Mapping) and response.get("status") in _CACHEABLE_STATUSES
+
+
+def _api_cache_key(
+    api_name: str,
+    query_params: Mapping[str, Any],
+    parse_json: bool | None,
+) -> tuple[Any, ...] | None:
+    try:
+        return (api_name, frozenset(query_params.items()), parse_json)
+    except TypeError:  # Multi-valued (list) parameters are not hashable; skip caching.
+        return None
+
+
+def _fetch_vworld_api(
+    api_info: VWorldApiDefinition,
+    query_params: dict[str, Any],
+    timeout: float,
+    parse_json: bool | None,
+) -> Any:
+    api_name = api_info.name
     raw_body, headers = request_bytes(
         api_info.endpoint,
         query_params,
@@ -158,7 +243,7 @@ def call_vworld_api(
 
     if parse_json:
         try:
-            return json.loads(raw_body.decode("utf-8"))
+            return _json_loads(raw_body)
         except json.JSONDecodeError as exc:
             raise VWorldAPIError(
                 f"Unable to decode JSON response from '{api_name}': {exc.msg}"
@@ -172,19 +257,42 @@ def _perform_address_search_request(
     category: str,
     timeout: float,
 ) -> dict[str, Any]:
-    query_params = dict(base_params)
-    query_params["category"] = category.upper()
-
     raw_body, _ = request_bytes(
         VWORLD_SEARCH_ENDPOINT,
-        query_params,
+        _with_category(base_params, category),
         timeout=timeout,
         error_cls=VWorldAPIError,
         service_name="vworld address search",
     )
+    return _parse_address_search_body(raw_body)
+
+
+async def _perform_address_search_request_async(
+    client: Any,
+    base_params: dict[str, Any],
+    category: str,
+    timeout: float,
+) -> dict[str, Any]:
+    raw_body, _ = await request_bytes_async(
+        client,
+        VWORLD_SEARCH_ENDPOINT,
+        _with_category(base_params, category),
+        timeout=timeout,
+        error_cls=VWorldAPIError,
+        service_name="vworld address search",
+    )
+    return _parse_address_search_body(raw_body)
+
 
+def _with_category(base_params: dict[str, Any], category: str) -> dict[str, Any]:
+    query_params = dict(base_params)
+    query_params["category"] = category.upper()
+    return query_params
+
+
+def _parse_address_search_body(raw_body: bytes) -> dict[str, Any]:
     try:
-        payload = json.loads(raw_body.decode("utf-8"))
+        payload = _json_loads(raw_body)
     except json.JSONDecodeError as exc:
         raise VWorldAPIError(
             f"Unable to decode JSON response from address search: {exc.msg}"
@@ -193,17 +301,22 @@ def _perform_address_search_request(
     response = payload.get("response")
     if not isinstance(response, Mapping):
         raise VWorldAPIError("Unexpected vworld address search payload: missing 'response'.")
-    response_data = dict(response)
+    response_data = response
 
     status = response_data.get("status")
     if status == "NOT_FOUND":
+        # Only this branch mutates; decoded JSON objects are plain dicts already.
+        if not isinstance(response_data, dict):
+            response_data = dict(response_data)
         result = response_data.get("result")
-        if isinstance(result, Mapping):
+        if isinstance(result, dict):
+            result_dict = result
+        elif isinstance(result, Mapping):
             result_dict = dict(result)
-            if not isinstance(result_dict.get("items"), list):
-                result_dict["items"] = []
         else:
-            result_dict = {"items": []}
+            result_dict = {}
+        if not isinstance(result_dict.get("items"), list):
+            result_dict["items"] = []
         response_data["result"] = result_dict
         return response_data
     if status != "OK":
@@ -220,36 +333,39 @@ def _perform_address_search_request(
     return response_data
 
 
+def _split_address(pattern: re.Pattern[str], value: str) -> tuple[str, str] | None:
+    candidate = value.strip()
+    if not candidate:
+        return None
+    match = pattern.search(candidate)
+    if not match and " " in candidate:
+        # Names split by spaces (e.g. "테헤란 로 152") only match once the spaces are removed.
+        match = pattern.search(candidate.replace(" ", ""))
+    if not match:
+        return None
+    return match.group(1), match.group(2)
+
+
+def _road_parts(value: str) -> tuple[str, str] | None:
+    return _split_address(_ROAD_RE, value)
+
+
+def _parcel_parts(value: str) -> tuple[str, str] | None:
+    return _split_address(_PARCEL_RE, value)
+
+
 def _perform_validated_address_search_request(
     address: str,
     options: str,
     items: Sequence[Mapping[str, Any]],
-) -> list[dict[str, Any]]:
-    """Filter search items to those that closely match ``address``."""
+) -> list[Mapping[str, Any]]:
+    """
+    Filter search items to those that closely match ``address``.
 
-    norm_address = address.strip()
+    Matching items are returned by reference, not copied.
+    """
 
-    def _road_parts(value: str) -> tuple[str, str] | None:
-        candidate = value.strip()
-        if not candidate:
-            return None
-        match = re.search(r"([^\d\s]{1,}(?:로|길))\s*(\d+(?:-\d+)?)", candidate)
-        if not match:
-            match = re.search(r"([^\d\s]{1,}(?:로|길))(\d+(?:-\d+)?)", candidate.replace(" ", ""))
-        if not match:
-            return None
-        return match.group(1), match.group(2)
-
-    def _parcel_parts(value: str) -> tuple[str, str] | None:
-        candidate = value.strip()
-        if not candidate:
-            return None
-        match = re.search(r"([^\d\s]{1,})(?:동|리|가)?\s*(\d+(?:-\d+)?)", candidate)
-        if not match:
-            match = re.search(r"([^\d\s]{1,})(?:동|리|가)?(\d+(?:-\d+)?)", candidate.replace(" ", ""))
-        if not match:
-            return None
-        return match.group(1), match.group(2)
+    norm_address = address.strip()
 
     def _address_field(item: Mapping[str, Any], key: str) -> str:
         block = item.get('address') if isinstance(item, Mapping) else None
@@ -263,50 +379,130 @@ def _perform_validated_address_search_request(
             return query == candidate
         return '-' not in candidate and query.split('-', 1)[0] == candidate.split('-', 1)[0]
 
-    filtered: list[dict[str, Any]] = []
     option = options.lower()
-
     if option == 'road':
-        parts = _road_parts(norm_address)
-        if not parts:
-            return [dict(item) for item in items]
-        query_name, query_no = parts
-        normalized_query_name = query_name.replace(' ', '')
-        for item in items:
-            candidate = _address_field(item, 'road')
-            if not candidate:
-                continue
-            candidate_parts = _road_parts(candidate)
-            if not candidate_parts:
-                continue
-            cand_name, cand_no = candidate_parts
-            if cand_name.replace(' ', '') != normalized_query_name:
-                continue
-            if _numbers_match(query_no, cand_no):
-                filtered.append(dict(item))
-        return filtered
-
-    if option == 'parcel':
-        parts = _parcel_parts(norm_address)
-        if not parts:
-            return [dict(item) for item in items]
-        query_name, query_no = parts
-        normalized_query_name = query_name.replace(' ', '')
-        for item in items:
-            candidate = _address_field(item, 'parcel')
-            if not candidate:
-                continue
-            candidate_parts = _parcel_parts(candidate)
-            if not candidate_parts:
-                continue
-            cand_name, cand_no = candidate_parts
-            if cand_name.replace(' ', '') != normalized_query_name:
-                continue
-            if _numbers_match(query_no, cand_no):
-                filtered.append(dict(item))
-        return filtered
-
-    return [dict(item) for item in items]
+        split_parts, field_key = _road_parts, 'road'
+    elif option == 'parcel':
+        split_parts, field_key = _parcel_parts, 'parcel'
+    else:
+        return list(items)
+
+    parts = split_parts(norm_address)
+    if not parts:
+        return list(items)
+    # Names are captured by ``[^\d\s]+`` and never contain whitespace, so they
+    # can be compared directly without per-item normalization.
+    query_name, query_no = parts
+
+    filtered: list[Mapping[str, Any]] = []
+    for item in items:
+        candidate = _address_field(item, field_key)
+        if not candidate:
+            continue
+        candidate_parts = split_parts(candidate)
+        if not candidate_parts:
+            continue
+        cand_name, cand_no = candidate_parts
+        if cand_name == query_name and _numbers_match(query_no, cand_no):
+            filtered.append(item)
+    return filtered
+
+
+def _build_address_search_params(
+    address: str,
+    *,
+    api_key: str,
+    crs: str,
+    size: int,
+    page: int,
+    bbox: Sequence[float] | None,
+    domain: str | None,
+    timeout: float,
+    format: str,
+    errorformat: str,
+    search_option: Any,
+) -> tuple[dict[str, Any], str]:
+    """Validate ``search_address`` arguments and return ``(query_params, category)``."""
+    if not address or not address.strip():
+        raise ValueError("address must be a non-empty string.")
+    if not api_key or not api_key.strip():
+        raise ValueError("api_key must be provided.")
+    if size < 1 or size > 1000:
+        raise ValueError("size must be between 1 and 1000.")
+    if page < 1:
+        raise ValueError("page must be greater than or equal to 1.")
+    if timeout <= 0:
+        raise ValueError("timeout must be greater than zero.")
+    if format.lower() != "json":
+        raise ValueError("only JSON format responses are supported by this helper.")
+    if errorformat.lower() != "json":
+        raise ValueError("only JSON errorformat responses are supported by this helper.")
+    query_params: dict[str, Any] = {
+        "service": "search",
+        "request": "search",
+        "version": "2.0",
+        "format": format,
+        "errorformat": errorformat,
+        "type": "address",
+        "crs": crs,
+        "size": size,
+        "page": page,
+        "query": address.strip(),
+        "key": api_key.strip(),
+    }
+
+    if bbox is not None:
+        if len(bbox) != 4:
+            raise ValueError("bbox must contain exactly four values: minx, miny, maxx, maxy.")
+        query_params["bbox"] = ",".join(str(value) for value in bbox)
+
+    if domain:
+        query_params['domain'] = domain
+
+    road_hint = bool(_ROAD_HINT_RE.search(address))
+
+    requested_category = str(search_option).upper() if search_option else 'PARCEL'
+    if road_hint:
+        requested_category = 'ROAD'
+    if requested_category not in {'ROAD', 'PARCEL'}:
+        requested_category = 'PARCEL'
+
+    return query_params, requested_category
+
+
+def _search_cache_key(
+    query_params: Mapping[str, Any],
+    category: str,
+    filter_option: Any,
+) -> tuple[Any, ...]:
+    # ``query_params`` already carries the normalized address, key, domain and paging.
+    return (frozenset(query_params.items()), category, bool(filter_option))
+
+
+def clear_vworld_cache() -> None:
+    """Drop all cached vworld API and address search responses."""
+    _API_RESPONSE_CACHE.clear()
+    _SEARCH_RESPONSE_CACHE.clear()
+
+
+def _fallback_category(category: str) -> str:
+    return 'PARCEL' if category == 'ROAD' else 'ROAD'
+
+
+def _filter_search_response(address: str, category: str, search_response: dict[str, Any]) -> None:
+    if search_response.get('status') != 'OK':
+        return
+    result_block = search_response.get('result')
+    items = []
+    if isinstance(result_block, Mapping):
+        items = result_block.get('items', [])
+    filtered_items = _perform_validated_address_search_request(
+        address,
+        'road' if category == 'ROAD' else 'parcel',
+        items,
+    )
+    if isinstance(result_block, dict):
+        result_block['items'] = filtered_items
 
 
 def search_address(
@@ -323,7 +519,8 @@ def search_address(
     format: str = "json",
     errorformat: str = "json",
     search_option = 'PARCEL',
-    filter_option = False
+    filter_option = False,
+    use_cache: bool = True,
 ) -> dict[str, Any]:
     """
     Query the vworld Search API for address information.
@@ -348,7 +545,7 @@ def search_address(
     domain:
         Optional domain parameter to include in the request.
     timeout:
-        Socket timeout (seconds) passed to ``urllib.request.urlopen``.
+        Socket timeout (seconds) for the HTTP request.
     format:
         Response format requested from the API. Only ``"json"`` is supported by this helper.
     errorformat:
@@ -359,6 +556,9 @@ def search_address(
         are found. This parameter can be used to force a specific category.
     filter_option:
         If ``True``, the returned results are filtered to ensure exact matches
+    use_cache:
+        Serve repeated identical searches from an in-process TTL cache. Cached
+        responses are shared objects and must not be mutated by callers.
 
     Returns
     -------
@@ -373,83 +573,197 @@ def search_address(
         If the API request fails or returns a non-JSON payload.
     """
     _ = category  # Kept for compatibility; actual search order is ROAD then PARCEL.
+    query_params, primary_category = _build_address_search_params(
+        address,
+        api_key=api_key,
+        crs=crs,
+        size=size,
+        page=page,
+        bbox=bbox,
+        domain=domain,
+        timeout=timeout,
+        format=format,
+        errorformat=errorformat,
+        search_option=search_option,
+    )
+    cache_key = _search_cache_key(query_params, primary_category, filter_option) if use_cache else None
+    if cache_key is not None:
+        cached = _SEARCH_RESPONSE_CACHE.get(cache_key, _CACHE_MISS)
+        if cached is not _CACHE_MISS:
+            return cached
 
+    search_response = _perform_address_search_request(query_params, primary_category, timeout)
 
-    if not address or not address.strip():
-        raise ValueError("address must be a non-empty string.")
-    if not api_key or not api_key.strip():
-        raise ValueError("api_key must be provided.")
-    if size < 1 or size > 1000:
-        raise ValueError("size must be between 1 and 1000.")
-    if page < 1:
-        raise ValueError("page must be greater than or equal to 1.")
-    if timeout <= 0:
-        raise ValueError("timeout must be greater than zero.")
-    if format.lower() != "json":
-        raise ValueError("only JSON format responses are supported by this helper.")
-    if errorformat.lower() != "json":
-        raise ValueError("only JSON errorformat responses are supported by this helper.")
-    query_params: dict[str, Any] = {
-        "service": "search",
-        "request": "search",
-        "version": "2.0",
-        "format": format,
-        "errorformat": errorformat,
-        "type": "address",
-        "crs": crs,
-        "size": size,
-        "page": page,
-        "query": address.strip(),
-        "key": api_key.strip(),
-    }
+    if search_response.get('status') == 'NOT_FOUND':
+        primary_category = _fallback_category(primary_category)
+        search_response = _perform_address_search_request(query_params, primary_category, timeout)
 
-    if bbox is not None:
-        if len(bbox) != 4:
-            raise ValueError("bbox must contain exactly four values: minx, miny, maxx, maxy.")
-        query_params["bbox"] = ",".join(str(value) for value in bbox)
+    if filter_option:
+        _filter_search_response(address, primary_category, search_response)
+
+    if cache_key is not None:
+        _SEARCH_RESPONSE_CACHE.set(cache_key, search_response)
+    return search_response
 
-    if domain:
-        query_params['domain'] = domain
 
-    road_hint = bool(
-        re.search(r"\d+\s*(?:로|길|번길)", address)
-        or re.search(r"[^\d\s]+(?:로|길)\s*\d", address)
+async def search_address_async(
+    address: str,
+    *,
+    api_key: str,
+    category: str = "ROAD",
+    crs: str = "EPSG:4326",
+    size: int = 10,
+    page: int = 1,
+    bbox: Sequence[float] | None = None,
+    domain: str | None = None,
+    timeout: float = 10.0,
+    format: str = "json",
+    errorformat: str = "json",
+    search_option = 'PARCEL',
+    filter_option = False,
+    use_cache: bool = True,
+    speculative: bool = False,
+    client: Any = None,
+) -> dict[str, Any]:
+    """
+    Async variant of :func:`search_address` backed by ``httpx.AsyncClient``.
+
+    Parameters match :func:`search_address`, plus:
+
+    speculative:
+        Issue the ROAD and PARCEL requests concurrently instead of falling back
+        sequentially. Costs one extra request per address but saves a round
+        trip whenever the primary category returns ``NOT_FOUND``.
+    client:
+        Optional shared ``httpx.AsyncClient`` (see
+        :func:`clients._http_helpers.create_async_client`). A temporary client
+        is created and closed when omitted.
+    """
+    _ = category  # Kept for compatibility with ``search_address``.
+    query_params, primary_category = _build_address_search_params(
+        address,
+        api_key=api_key,
+        crs=crs,
+        size=size,
+        page=page,
+        bbox=bbox,
+        domain=domain,
+        timeout=timeout,
+        format=format,
+        errorformat=errorformat,
+        search_option=search_option,
     )
+    cache_key = _search_cache_key(query_params, primary_category, filter_option) if use_cache else None
+    if cache_key is not None:
+        cached = _SEARCH_RESPONSE_CACHE.get(cache_key, _CACHE_MISS)
+        if cached is not _CACHE_MISS:
+            return cached
+
+    if client is None:
+        async with create_async_client(timeout) as own_client:
+            search_response = await _resolve_address_async(
+                own_client, address, query_params, primary_category, timeout, filter_option, speculative
+            )
+    else:
+        search_response = await _resolve_address_async(
+            client, address, query_params, primary_category, timeout, filter_option, speculative
+        )
 
-    requested_category = str(search_option).upper() if search_option else 'PARCEL'
-    if road_hint:
-        requested_category = 'ROAD'
-    if requested_category not in {'ROAD', 'PARCEL'}:
-        requested_category = 'PARCEL'
+    if cache_key is not None:
+        _SEARCH_RESPONSE_CACHE.set(cache_key, search_response)
+    return search_response
 
-    primary_category = requested_category
-    search_response = _perform_address_search_request(query_params, primary_category, timeout)
 
-    if search_response.get('status') == 'NOT_FOUND':
-        fallback_category = 'PARCEL' if primary_category == 'ROAD' else 'ROAD'
-        search_response = _perform_address_search_request(query_params, fallback_category, timeout)
-        primary_category = fallback_category
-
-    if filter_option and search_response.get('status') == 'OK':
-        result_block = search_response.get('result')
-        items = []
-        if isinstance(result_block, Mapping):
-            items = result_block.get('items', [])
-        filtered_items = _perform_validated_address_search_request(
-            address,
-            'road' if primary_category == 'ROAD' else 'parcel',
-            items,
+async def _resolve_address_async(
+    client: Any,
+    address: str,
+    query_params: dict[str, Any],
+    primary_category: str,
+    timeout: float,
+    filter_option: bool,
+    speculative: bool,
+) -> dict[str, Any]:
+    fallback_category = _fallback_category(primary_category)
+    if speculative:
+        primary, fallback = await asyncio.gather(
+            _perform_address_search_request_async(client, query_params, primary_category, timeout),
+            _perform_address_search_request_async(client, query_params, fallback_category, timeout),
+            return_exceptions=True,
+        )
+        if isinstance(primary, BaseException):
+            raise primary
+        search_response = primary
+        if search_response.get('status') == 'NOT_FOUND':
+            if isinstance(fallback, BaseException):
+                raise fallback
+            search_response = fallback
+            primary_category = fallback_category
+    else:
+        search_response = await _perform_address_search_request_async(
+            client, query_params, primary_category, timeout
         )
-        if isinstance(result_block, Mapping):
-            result_block['items'] = filtered_items
+        if search_response.get('status') == 'NOT_FOUND':
+            search_response = await _perform_address_search_request_async(
+                client, query_params, fallback_category, timeout
+            )
+            primary_category = fallback_category
+
+    if filter_option:
+        _filter_search_response(address, primary_category, search_response)
 
     return search_response
 
 
+async def search_addresses(
+    addresses: Iterable[str],
+    *,
+    api_key: str,
+    concurrency: int = 8,
+    timeout: float = 10.0,
+    max_connections: int = 32,
+    **search_kwargs: Any,
+) -> list[dict[str, Any] | BaseException]:
+    """
+    Resolve many addresses concurrently over a single ``httpx.AsyncClient``.
+
+    At most ``concurrency`` lookups are in flight at once. Remaining keyword
+    arguments are forwarded to :func:`search_address_async`.
+
+    Returns
+    -------
+    list[dict[str, Any] | BaseException]
+        One entry per input address, in order. Failed lookups are returned as
+        the raised exception instead of aborting the whole batch.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be greater than or equal to 1.")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    async with create_async_client(timeout, max_connections=max_connections) as client:
+
+        async def _bounded(address: str) -> dict[str, Any]:
+            async with semaphore:
+                return await search_address_async(
+                    address,
+                    api_key=api_key,
+                    timeout=timeout,
+                    client=client,
+                    **search_kwargs,
+                )
+
+        return await asyncio.gather(
+            *(_bounded(address) for address in addresses),
+            return_exceptions=True,
+        )
+
+
 
 __all__ = [
     "call_vworld_api",
+    "clear_vworld_cache",
     "get_vworld_api_info",
     "VWorldAPIError",
     "search_address",
+    "search_address_async",
+    "search_addresses",
 ]
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import importlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from types import ModuleType
 from typing import Any
 
 
@@ -12,16 +13,32 @@ class ClientLoadError(RuntimeError):
 @dataclass
 class ClientLoader:
     default_timeout: float = 8.0
+    _registry: dict[str, ModuleType] = field(default_factory=dict, init=False, repr=False)
+
+    def register(self, name: str, module_path: str) -> ModuleType:
+        """Import ``module_path`` once and serve it for ``name`` from then on."""
+        try:
+            module = importlib.import_module(module_path)
+        except ModuleNotFoundError as exc:
+            raise ClientLoadError(f"Could not load client '{name}': {exc}") from exc
+        self._registry[name] = module
+        return module
 
     def load(self, name: str) -> Any:
+        module = self._registry.get(name)
+        if module is not None:
+            return module
+
         candidates = [f"clients.{name}_client", f"clients.{name}"]
         last_error: Exception | None = None
         for candidate in candidates:
             try:
-                return importlib.import_module(candidate)
+                module = importlib.import_module(candidate)
             except ModuleNotFoundError as exc:
                 last_error = exc
                 continue
+            self._registry[name] = module
+            return module
         raise ClientLoadError(f"Could not load client '{name}': {last_error}")
 
     def call(self, client: Any, method: str, *args: Any, **kwargs: Any) -> Any:
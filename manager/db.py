@@ -4,12 +4,38 @@ import hashlib
 import json
 import sqlite3
 import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Iterable, Mapping, Sequence
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up.
+    orjson = None
+
+
+# Conservative default for SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds.
+_SQLITE_MAX_PARAMS = 999
+
+# Paths whose database lives inside a single connection and cannot be shared.
+_PRIVATE_DB_PATHS = frozenset({":memory:", ""})
+
+_SCD2_FAR_FUTURE = "9999-12-31T00:00:00+00:00"
+_SELECT_HISTORY_SQL = "SELECT * FROM ingestion_history ORDER BY id DESC LIMIT ?;"
 
 
 def _utcnow_iso() -> str:
-    return datetime.utcnow().replace(tzinfo=timezone.utc).isoformat()
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat()
+
+
+def _dump_details(details: Mapping[str, Any]) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(details, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass  # Fall back to the stdlib encoder for types orjson rejects.
+    return json.dumps(details, ensure_ascii=False)
 
 
 class DBAdapter:
@@ -19,25 +45,59 @@ class DBAdapter:
     The adapter is intentionally simple to avoid external dependencies while
     still providing transactional guarantees and optimistic concurrency for
     SCD2 upserts.
+
+    Each thread gets its own autocommit connection so WAL readers never wait
+    on each other; SCD2 writes coordinate through ``BEGIN IMMEDIATE``.
+    In-memory databases are private to a single connection, so for those the
+    adapter keeps one shared connection and serializes access with a lock.
     """
 
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self._lock = threading.RLock()
-        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
-        self._configure()
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._shared_conn: sqlite3.Connection | None = None
+        self._shared_lock = threading.RLock()
+        if db_path in _PRIVATE_DB_PATHS:
+            self._shared_conn = self._open_conn()
         self.ensure_history_schema()
 
     # ------------------------------------------------------------------ setup
-    def _configure(self) -> None:
-        with self._conn:
-            self._conn.execute("PRAGMA journal_mode=WAL;")
-            self._conn.execute("PRAGMA synchronous=NORMAL;")
+    def _open_conn(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        conn.row_factory = sqlite3.Row
+        self._configure(conn)
+        return conn
+
+    def _get_conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open_conn()
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        if self._shared_conn is not None:
+            with self._shared_lock:
+                yield self._shared_conn
+        else:
+            yield self._get_conn()
+
+    @staticmethod
+    def _configure(conn: sqlite3.Connection) -> None:
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.execute("PRAGMA busy_timeout=5000;")
 
     def ensure_history_schema(self) -> None:
-        with self._conn:
-            self._conn.execute(
+        with self._connection() as conn, conn:
+            conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS ingestion_history (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -52,6 +112,10 @@ class DBAdapter:
                 );
                 """
             )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_history_job_started "
+                "ON ingestion_history(job_name, started_at DESC);"
+            )
 
     # ----------------------------------------------------------------- helpers
     def log_history(
@@ -68,9 +132,9 @@ class DBAdapter:
     ) -> int:
         payload = details
         if isinstance(details, Mapping):
-            payload = json.dumps(details, ensure_ascii=False)
-        with self._lock, self._conn:
-            cursor = self._conn.execute(
+            payload = _dump_details(details)
+        with self._connection() as conn, conn:
+            cursor = conn.execute(
                 """
                 INSERT INTO ingestion_history
                 (job_name, event_type, status, started_at, ended_at, duration_ms, row_count, details)
@@ -90,11 +154,8 @@ class DBAdapter:
         return int(cursor.lastrowid)
 
     def fetch_history(self, limit: int = 50) -> list[dict[str, Any]]:
-        with self._lock, self._conn:
-            rows = self._conn.execute(
-                "SELECT * FROM ingestion_history ORDER BY id DESC LIMIT ?;",
-                (limit,),
-            ).fetchall()
+        with self._connection() as conn:
+            rows = conn.execute(_SELECT_HISTORY_SQL, (limit,)).fetchall()
         return [dict(row) for row in rows]
 
     # ------------------------------------------------------------------- SCD2
@@ -106,8 +167,8 @@ class DBAdapter:
     ) -> None:
         key_cols = ", ".join(f"{name} TEXT NOT NULL" for name in key_fields)
         attr_cols = ", ".join(f"{name} TEXT" for name in attribute_fields)
-        with self._lock, self._conn:
-            self._conn.execute(
+        with self._connection() as conn, conn:
+            conn.execute(
                 f"""
                 CREATE TABLE IF NOT EXISTS {table} (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -121,19 +182,21 @@ class DBAdapter:
                 """
             )
             idx_cols = "_".join(key_fields)
-            self._conn.execute(
+            conn.execute(
                 f"CREATE INDEX IF NOT EXISTS idx_{table}_{idx_cols} ON {table} ({', '.join(key_fields)});"
             )
-            self._conn.execute(
+            conn.execute(
                 f"CREATE INDEX IF NOT EXISTS idx_{table}_current ON {table}(is_current);"
             )
 
     def _compute_hash(self, record: Mapping[str, Any], fields: Sequence[str]) -> str:
-        hasher = hashlib.sha256()
-        for field in fields:
-            value = "" if record.get(field) is None else str(record.get(field))
-            hasher.update(value.encode("utf-8"))
-        return hasher.hexdigest()
+        # ASCII unit separator keeps field boundaries distinct ("ab", "c" vs "a", "bc").
+        return hashlib.sha256(
+            b"\x1f".join(
+                ("" if (value := record.get(field)) is None else str(value)).encode("utf-8")
+                for field in fields
+            )
+        ).hexdigest()
 
     def upsert_scd2(
         self,
@@ -156,40 +219,94 @@ class DBAdapter:
             attribute_fields = [f for f in rows[0].keys() if f not in key_fields]
         self.ensure_scd2_table(table, key_fields, attribute_fields)
 
-        inserted = 0
+        hash_fields = tuple(attribute_fields)
+        columns = list(key_fields) + list(attribute_fields)
         now = _utcnow_iso()
-        with self._lock, self._conn:
-            for row in rows:
-                row_hash = self._compute_hash(row, attribute_fields)
-                key_values = [row[field] for field in key_fields]
-                placeholders = " AND ".join(f"{field}=?" for field in key_fields)
-                current = self._conn.execute(
-                    f"""
-                    SELECT id, row_hash FROM {table}
-                    WHERE {placeholders} AND is_current=1
-                    ORDER BY id DESC LIMIT 1;
-                    """,
-                    key_values,
-                ).fetchone()
-                if current and current["row_hash"] == row_hash:
+
+        close_params: list[tuple[str, int]] = []
+        insert_params: list[list[Any]] = []
+        with self._write_lock, self._connection() as conn, conn:
+            conn.execute("BEGIN IMMEDIATE;")
+            raw_keys = [tuple(row[field] for field in key_fields) for row in rows]
+            stored_keys, current = self._fetch_current_versions(
+                conn, table, key_fields, raw_keys
+            )
+            latest_hash = {key: row_hash for key, (_, row_hash) in current.items()}
+            pending: dict[tuple[Any, ...], int] = {}
+            for row, raw_key in zip(rows, raw_keys):
+                key = stored_keys[raw_key]
+                row_hash = self._compute_hash(row, hash_fields)
+                if latest_hash.get(key) == row_hash:
                     continue
-                if current:
-                    self._conn.execute(
-                        f"""
-                        UPDATE {table}
-                        SET valid_to=?, is_current=0
-                        WHERE id=?;
-                        """,
-                        (now, current["id"]),
-                    )
-                columns = list(key_fields) + list(attribute_fields)
-                values = [row.get(col) for col in columns]
-                self._conn.execute(
+                if key in pending:
+                    # Superseded by a later record in the same batch.
+                    superseded = insert_params[pending[key]]
+                    superseded[-3:-1] = [now, 0]
+                elif key in current:
+                    close_params.append((now, current[key][0]))
+                pending[key] = len(insert_params)
+                latest_hash[key] = row_hash
+                insert_params.append(
+                    [*(row.get(col) for col in columns), now, _SCD2_FAR_FUTURE, 1, row_hash]
+                )
+
+            if close_params:
+                conn.executemany(
+                    f"UPDATE {table} SET valid_to=?, is_current=0 WHERE id=?;",
+                    close_params,
+                )
+            if insert_params:
+                conn.executemany(
                     f"""
                     INSERT INTO {table} ({', '.join(columns)}, valid_from, valid_to, is_current, row_hash)
-                    VALUES ({', '.join('?' for _ in columns)}, ?, ?, 1, ?);
+                    VALUES ({', '.join('?' for _ in columns)}, ?, ?, ?, ?);
                     """,
-                    (*values, now, "9999-12-31T00:00:00+00:00", row_hash),
+                    insert_params,
                 )
-                inserted += 1
-        return inserted
+        return len(insert_params)
+
+    def _fetch_current_versions(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        key_fields: Sequence[str],
+        raw_keys: Iterable[tuple[Any, ...]],
+    ) -> tuple[dict[tuple[Any, ...], tuple[Any, ...]], dict[tuple[Any, ...], tuple[int, str]]]:
+        """
+        Look up the current version of each key.
+
+        Raw key values are bound as-is so the TEXT affinity of the key columns
+        coerces them exactly like a ``WHERE key=?`` lookup would. Returns
+        ``({raw_key: stored_key}, {stored_key: (id, row_hash)})`` where
+        ``stored_key`` is the key's TEXT form, letting equal keys given as
+        different Python values (``1``/``"1"``/``True``) share one version chain.
+        """
+        key_list = list(dict.fromkeys(raw_keys))
+        width = len(key_fields)
+        value_cols = ", ".join(f"_k{i}" for i in range(width))
+        cast_cols = ", ".join(f"CAST(q._k{i} AS TEXT)" for i in range(width))
+        join_on = " AND ".join(f"t.{field} = q._k{i}" for i, field in enumerate(key_fields))
+        row_placeholder = f"({', '.join('?' for _ in range(width + 1))})"
+        chunk_size = max(1, _SQLITE_MAX_PARAMS // (width + 1))
+
+        stored_keys: dict[tuple[Any, ...], tuple[Any, ...]] = {}
+        current: dict[tuple[Any, ...], tuple[int, str]] = {}
+        for start in range(0, len(key_list), chunk_size):
+            chunk = key_list[start : start + chunk_size]
+            rows = conn.execute(
+                f"""
+                WITH q(_idx, {value_cols}) AS (
+                    VALUES {', '.join(row_placeholder for _ in chunk)}
+                )
+                SELECT q._idx, {cast_cols}, t.id, t.row_hash
+                FROM q LEFT JOIN {table} t ON {join_on} AND t.is_current=1
+                ORDER BY q._idx, t.id;
+                """,
+                [value for idx, key in enumerate(chunk) for value in (idx, *key)],
+            ).fetchall()
+            for row in rows:
+                stored_key = tuple(row[1 : width + 1])
+                stored_keys[chunk[row[0]]] = stored_key
+                if row["id"] is not None:
+                    current[stored_key] = (row["id"], row["row_hash"])
+        return stored_keys, current